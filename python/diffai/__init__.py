@@ -12,15 +12,197 @@ Example:
         print(f"{change['type']}: {change['path']}")
 """
 
-from ._diffai import (
-    diff,
-    diff_paths,
-    format_output,
-)
+from dataclasses import dataclass, fields
+from typing import Optional
 
 __all__ = [
+    "DiffOptions",
     "diff",
+    "diff_any",
+    "diff_many",
     "diff_paths",
+    "diff_paths_many",
+    "diff_raw",
     "format_output",
 ]
 __version__ = "0.5.0"
+
+_backend = None
+
+# Names re-exported from the backend on first access (PEP 562).
+_BACKEND_ATTRS = frozenset({"format_output"})
+
+
+def _load_backend():
+    """Import the native extension, or the pure-Python fallback, on first use.
+
+    Deferred so that `import diffai` stays cheap: loading the Rust cdylib
+    (mmap plus module init) is only paid by callers that actually diff
+    something, not by consumers that just read `__version__`.
+    """
+    global _backend
+    if _backend is None:
+        try:
+            from . import _diffai as _backend
+        except ImportError:
+            # No prebuilt wheel for this platform; degrade to the pure-Python
+            # backend (optionally Numba-accelerated) instead of failing.
+            from . import _fallback as _backend
+    return _backend
+
+
+def __getattr__(name):
+    if name in _BACKEND_ATTRS:
+        value = getattr(_load_backend(), name)
+        # Cache in the module namespace so later lookups skip __getattr__.
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _BACKEND_ATTRS)
+
+
+@dataclass(frozen=True)
+class DiffOptions:
+    """Reusable diff options.
+
+    The same kwargs accepted by diff() and diff_paths(), parsed and validated
+    once. Passing an instance via the ``options`` argument skips the per-call
+    kwargs parsing in the native layer, which matters when diffing many pairs
+    in a loop.
+
+    ``atol`` is an alias of ``epsilon``; ``rtol`` adds a relative component so
+    that numbers within ``atol + rtol * max(|a|, |b|)`` compare equal, which
+    handles tensors whose values span several orders of magnitude.
+
+    Example:
+        opts = diffai.DiffOptions(epsilon=1e-6)
+        for old, new in checkpoints:
+            results = diffai.diff(old, new, options=opts)
+    """
+
+    epsilon: Optional[float] = None
+    atol: Optional[float] = None
+    rtol: Optional[float] = None
+    array_id_key: Optional[str] = None
+    ignore_keys_regex: Optional[str] = None
+    path_filter: Optional[str] = None
+    output_format: Optional[str] = None
+
+    def compile(self):
+        """Return the native pre-parsed handle, building it on first use."""
+        compiled = self.__dict__.get("_compiled")
+        if compiled is None:
+            kwargs = {
+                f.name: getattr(self, f.name)
+                for f in fields(self)
+                if getattr(self, f.name) is not None
+            }
+            compiled = _load_backend()._compile_options(**kwargs)
+            object.__setattr__(self, "_compiled", compiled)
+        return compiled
+
+
+def diff(old, new, options=None, **kwargs):
+    """Compare two Python objects and return the list of differences.
+
+    Accepts either individual option kwargs (epsilon=..., etc.) or a
+    pre-compiled DiffOptions instance via ``options``.
+    """
+    # Identity is only a short-circuit when there is nothing to validate;
+    # with any options present the backend must still see (and reject
+    # misspelled) kwargs.
+    if old is new and options is None and not kwargs:
+        return []
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff(old, new, **kwargs)
+
+
+def diff_any(old, new, options=None, **kwargs):
+    """Return True if the two objects differ structurally past the tolerance.
+
+    Short-circuits on the first mismatch without building result entries,
+    which is cheaper than len(diff(...)) for gate-style checks. Only the
+    structural entry types (Added, Removed, Modified, TypeChanged) count;
+    the ML-analysis entries that diff() may append for model-like inputs
+    are ignored.
+    """
+    # Same caveat as diff(): only short-circuit when no options need
+    # validating.
+    if old is new and options is None and not kwargs:
+        return False
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff_any(old, new, **kwargs)
+
+
+def diff_raw(old, new, options=None, **kwargs):
+    """Compare two Python objects, keeping the results in the backend.
+
+    The returned handle supports len() and to_list(), and feeds
+    format_output() without materializing a Python dict per entry. Use this
+    when the end goal is a formatted string rather than the result dicts.
+    """
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff_raw(old, new, **kwargs)
+
+
+def diff_many(pairs, options=None, **kwargs):
+    """Compare many (old, new) pairs in a single call.
+
+    Options are parsed once for the whole batch; a DiffOptions instance
+    passed via ``options`` is compiled the same way diff() compiles it.
+    """
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff_many(pairs, **kwargs)
+
+
+def diff_paths_many(path_pairs, options=None, **kwargs):
+    """Compare many (old_path, new_path) pairs in a single call.
+
+    Options are parsed once for the whole batch; a DiffOptions instance
+    passed via ``options`` is compiled the same way diff_paths() compiles it.
+    """
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff_paths_many(path_pairs, **kwargs)
+
+
+def diff_paths(old_path, new_path, options=None, **kwargs):
+    """Compare two files or directories and return the list of differences.
+
+    Accepts either individual option kwargs (epsilon=..., etc.) or a
+    pre-compiled DiffOptions instance via ``options``.
+    """
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        kwargs["options"] = (
+            options.compile() if isinstance(options, DiffOptions) else options
+        )
+    return _load_backend().diff_paths(old_path, new_path, **kwargs)
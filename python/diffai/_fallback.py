@@ -0,0 +1,540 @@
+"""Pure-Python fallback used when the native extension is unavailable.
+
+Mirrors the Rust core's structural diff semantics for dict/list/scalar data:
+added, removed, and modified keys, type changes, epsilon tolerance, key
+ignoring, and path filtering. Float-array leaves go through a Numba-compiled
+kernel when numba and numpy are installed (the loop auto-vectorizes under
+LLVM); otherwise a plain Python loop is used.
+
+This backend covers the in-memory API. File comparison is limited to JSON;
+model file formats (PyTorch, Safetensors, NumPy, MATLAB) require the native
+extension.
+"""
+
+import json
+import re
+
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+__all__ = [
+    "diff",
+    "diff_any",
+    "diff_many",
+    "diff_paths",
+    "diff_paths_many",
+    "diff_raw",
+    "format_output",
+]
+
+
+class _CompiledOptions:
+    """Pre-parsed diff options for the fallback backend."""
+
+    __slots__ = (
+        "epsilon",
+        "rtol",
+        "array_id_key",
+        "ignore_keys_regex",
+        "path_filter",
+        "output_format",
+    )
+
+    def __init__(
+        self,
+        epsilon=None,
+        atol=None,
+        rtol=None,
+        array_id_key=None,
+        ignore_keys_regex=None,
+        path_filter=None,
+        output_format=None,
+    ):
+        if output_format not in (None, "diffai", "json", "yaml"):
+            raise ValueError(f"Invalid output format: {output_format}")
+        if atol is not None:
+            if epsilon is not None:
+                raise ValueError("epsilon is an alias for atol; specify only one")
+            epsilon = atol
+        if rtol is not None and rtol < 0:
+            raise ValueError("rtol must be non-negative")
+        self.epsilon = epsilon
+        self.rtol = rtol if rtol is not None else 0.0
+        self.array_id_key = array_id_key
+        self.ignore_keys_regex = (
+            re.compile(ignore_keys_regex) if ignore_keys_regex is not None else None
+        )
+        self.path_filter = path_filter
+        self.output_format = output_format
+
+
+def _compile_options(**kwargs):
+    return _CompiledOptions(**kwargs)
+
+
+def _resolve_options(kwargs):
+    options = kwargs.pop("options", None)
+    if options is not None:
+        if kwargs:
+            raise TypeError("options cannot be combined with individual option kwargs")
+        if not isinstance(options, _CompiledOptions):
+            raise TypeError("options must be a compiled DiffOptions handle")
+        return options
+    return _CompiledOptions(**kwargs)
+
+
+if _njit is not None:
+
+    @_njit(cache=True)
+    def _compare_f64(a, b, atol, rtol):
+        """Return indices where |a[i] - b[i]| > atol + rtol * max(|a|, |b|).
+
+        A straight loop over contiguous float64 data; LLVM auto-vectorizes
+        the subtract/abs/fma/compare under Numba.
+        """
+        idx = _np.empty(a.shape[0], _np.int64)
+        n = 0
+        for i in range(a.shape[0]):
+            d = a[i] - b[i]
+            if d < 0.0:
+                d = -d
+            ma = a[i] if a[i] >= 0.0 else -a[i]
+            mb = b[i] if b[i] >= 0.0 else -b[i]
+            m = ma if ma >= mb else mb
+            if d > atol + rtol * m:
+                idx[n] = i
+                n += 1
+        return idx[:n]
+
+else:
+    _compare_f64 = None
+
+
+def _kind(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    if _np is not None and isinstance(value, _np.ndarray):
+        return "array"
+    try:
+        memoryview(value)
+    except TypeError:
+        raise TypeError("Unsupported Python type") from None
+    return "array"
+
+
+def _to_plain(value):
+    """Convert a value to plain JSON-compatible Python objects."""
+    kind = _kind(value)
+    if kind == "object":
+        return {key: _to_plain(item) for key, item in value.items()}
+    if kind == "array":
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _child_path(path, key):
+    return f"{path}.{key}" if path else str(key)
+
+
+def _index_path(path, index):
+    return f"{path}[{index}]"
+
+
+def _numbers_equal(old, new, opts):
+    if opts.rtol:
+        atol = opts.epsilon if opts.epsilon is not None else 0.0
+        return abs(old - new) <= atol + opts.rtol * max(abs(old), abs(new))
+    if opts.epsilon is not None:
+        return abs(old - new) <= opts.epsilon
+    # Mirror serde_json exact equality: without a tolerance, an int and a
+    # float never compare equal in the core (Number(1) != Number(1.0)).
+    return old == new and isinstance(old, float) == isinstance(new, float)
+
+
+def _format_id(id_value):
+    """Format an array_id_key value for paths the way the core does.
+
+    String ids are quoted ([id="x"]); numbers and bools use their JSON
+    rendering.
+    """
+    if isinstance(id_value, str):
+        return f'"{id_value}"'
+    if isinstance(id_value, bool):
+        return "true" if id_value else "false"
+    return str(id_value)
+
+
+def _is_float_array(value):
+    return (
+        _np is not None
+        and isinstance(value, _np.ndarray)
+        and value.ndim == 1
+        and value.dtype.kind == "f"
+    )
+
+
+def _diff_float_arrays(path, old, new, opts, results):
+    a = _np.ascontiguousarray(old, dtype=_np.float64)
+    b = _np.ascontiguousarray(new, dtype=_np.float64)
+    atol = opts.epsilon if opts.epsilon is not None else 0.0
+    for i in _compare_f64(a, b, atol, opts.rtol):
+        results.append(
+            {
+                "type": "Modified",
+                "path": _index_path(path, int(i)),
+                "old_value": float(a[i]),
+                "new_value": float(b[i]),
+            }
+        )
+
+
+def _diff_arrays(path, old, new, opts, results):
+    if (
+        _compare_f64 is not None
+        and _is_float_array(old)
+        and _is_float_array(new)
+        and old.shape == new.shape
+    ):
+        _diff_float_arrays(path, old, new, opts, results)
+        return
+
+    old_list = old if isinstance(old, list) else list(old)
+    new_list = new if isinstance(new, list) else list(new)
+
+    id_key = opts.array_id_key
+    if id_key is not None:
+        # Mirror the core: items carrying the id key are matched by id (with
+        # string ids quoted in the path); the remaining items are matched
+        # positionally, keyed by their original array index.
+        old_by_id, old_without_id = {}, []
+        for index, item in enumerate(old_list):
+            if isinstance(item, dict) and id_key in item:
+                old_by_id[_format_id(item[id_key])] = item
+            else:
+                old_without_id.append((index, item))
+        new_by_id, new_without_id = {}, []
+        for index, item in enumerate(new_list):
+            if isinstance(item, dict) and id_key in item:
+                new_by_id[_format_id(item[id_key])] = item
+            else:
+                new_without_id.append((index, item))
+
+        for item_id, old_item in old_by_id.items():
+            if item_id not in new_by_id:
+                results.append(
+                    {
+                        "type": "Removed",
+                        "path": f"{path}[{id_key}={item_id}]",
+                        "value": _to_plain(old_item),
+                    }
+                )
+        for item_id, new_item in new_by_id.items():
+            item_path = f"{path}[{id_key}={item_id}]"
+            if item_id in old_by_id:
+                _diff_values(item_path, old_by_id[item_id], new_item, opts, results)
+            else:
+                results.append(
+                    {"type": "Added", "path": item_path, "value": _to_plain(new_item)}
+                )
+
+        for i in range(max(len(old_without_id), len(new_without_id))):
+            if i < len(old_without_id) and i < len(new_without_id):
+                index, old_item = old_without_id[i]
+                _diff_values(
+                    _index_path(path, index),
+                    old_item,
+                    new_without_id[i][1],
+                    opts,
+                    results,
+                )
+            elif i < len(old_without_id):
+                index, old_item = old_without_id[i]
+                results.append(
+                    {
+                        "type": "Removed",
+                        "path": _index_path(path, index),
+                        "value": _to_plain(old_item),
+                    }
+                )
+            else:
+                index, new_item = new_without_id[i]
+                results.append(
+                    {
+                        "type": "Added",
+                        "path": _index_path(path, index),
+                        "value": _to_plain(new_item),
+                    }
+                )
+        return
+
+    common = min(len(old_list), len(new_list))
+    for i in range(common):
+        _diff_values(_index_path(path, i), old_list[i], new_list[i], opts, results)
+    for i in range(common, len(old_list)):
+        results.append(
+            {
+                "type": "Removed",
+                "path": _index_path(path, i),
+                "value": _to_plain(old_list[i]),
+            }
+        )
+    for i in range(common, len(new_list)):
+        results.append(
+            {
+                "type": "Added",
+                "path": _index_path(path, i),
+                "value": _to_plain(new_list[i]),
+            }
+        )
+
+
+def _diff_values(path, old, new, opts, results):
+    # A subtree aliased between old and new cannot differ from itself.
+    if old is new:
+        return
+
+    old_kind = _kind(old)
+    new_kind = _kind(new)
+
+    if old_kind != new_kind:
+        results.append(
+            {
+                "type": "TypeChanged",
+                "path": path,
+                "old_value": _to_plain(old),
+                "new_value": _to_plain(new),
+            }
+        )
+        return
+
+    if old_kind == "object":
+        ignore = opts.ignore_keys_regex
+        for key, old_item in old.items():
+            if ignore is not None and ignore.search(str(key)):
+                continue
+            child = _child_path(path, key)
+            if key in new:
+                _diff_values(child, old_item, new[key], opts, results)
+            else:
+                results.append(
+                    {"type": "Removed", "path": child, "value": _to_plain(old_item)}
+                )
+        for key, new_item in new.items():
+            if ignore is not None and ignore.search(str(key)):
+                continue
+            if key not in old:
+                results.append(
+                    {
+                        "type": "Added",
+                        "path": _child_path(path, key),
+                        "value": _to_plain(new_item),
+                    }
+                )
+        return
+
+    if old_kind == "array":
+        _diff_arrays(path, old, new, opts, results)
+        return
+
+    if old_kind == "number":
+        if not _numbers_equal(old, new, opts):
+            results.append(
+                {"type": "Modified", "path": path, "old_value": old, "new_value": new}
+            )
+        return
+
+    if old != new:
+        results.append(
+            {"type": "Modified", "path": path, "old_value": old, "new_value": new}
+        )
+
+
+def _values_differ(old, new, opts):
+    if old is new:
+        return False
+
+    old_kind = _kind(old)
+    new_kind = _kind(new)
+    if old_kind != new_kind:
+        return True
+
+    if old_kind == "object":
+        ignore = opts.ignore_keys_regex
+        for key, old_item in old.items():
+            if ignore is not None and ignore.search(str(key)):
+                continue
+            if key not in new:
+                return True
+            if _values_differ(old_item, new[key], opts):
+                return True
+        for key in new:
+            if ignore is not None and ignore.search(str(key)):
+                continue
+            if key not in old:
+                return True
+        return False
+
+    if old_kind == "array":
+        old_list = old if isinstance(old, list) else list(old)
+        new_list = new if isinstance(new, list) else list(new)
+        if len(old_list) != len(new_list):
+            return True
+        return any(
+            _values_differ(old_item, new_item, opts)
+            for old_item, new_item in zip(old_list, new_list)
+        )
+
+    if old_kind == "number":
+        return not _numbers_equal(old, new, opts)
+
+    return old != new
+
+
+def diff_any(old, new, **kwargs):
+    """Return True if any structural difference exists.
+
+    Stops at the first mismatch. Like the native backend, this counts only
+    the structural entry types (Added, Removed, Modified, TypeChanged), not
+    the ML-analysis entries the native diff() may append.
+    """
+    opts = _resolve_options(kwargs)
+    # Options that re-shape the walk itself are handled by the full diff.
+    if opts.path_filter is not None or opts.array_id_key is not None:
+        return len(diff(old, new, options=opts)) > 0
+    return _values_differ(old, new, opts)
+
+
+def diff(old, new, **kwargs):
+    """Compare two Python objects and return differences (pure-Python path)."""
+    opts = _resolve_options(kwargs)
+    results = []
+    _diff_values("", old, new, opts, results)
+    if opts.path_filter is not None:
+        results = [r for r in results if opts.path_filter in r["path"]]
+    return results
+
+
+def diff_many(pairs, **kwargs):
+    """Compare many (old, new) pairs, parsing options once."""
+    opts = _resolve_options(kwargs)
+    return [diff(old, new, options=opts) for old, new in pairs]
+
+
+class _RawResults(list):
+    """Diff results list mirroring the native diff_raw() handle API."""
+
+    def to_list(self):
+        return list(self)
+
+
+def diff_raw(old, new, **kwargs):
+    """Compare two Python objects, returning a handle for format_output().
+
+    The fallback has no native result vector, so this is the regular diff
+    wrapped in a thin handle for API parity.
+    """
+    return _RawResults(diff(old, new, **kwargs))
+
+
+def _load_file(path):
+    if not str(path).endswith(".json"):
+        raise RuntimeError(
+            f"Cannot compare '{path}': the pure-Python fallback only reads JSON "
+            "files; install a platform with the native diffai extension for "
+            "PyTorch/Safetensors/NumPy/MATLAB files"
+        )
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def diff_paths(old_path, new_path, **kwargs):
+    """Compare two JSON files (pure-Python path)."""
+    opts = _resolve_options(kwargs)
+    return diff(_load_file(old_path), _load_file(new_path), options=opts)
+
+
+def diff_paths_many(path_pairs, **kwargs):
+    """Compare many (old_path, new_path) pairs, parsing options once."""
+    opts = _resolve_options(kwargs)
+    return [diff_paths(old, new, options=opts) for old, new in path_pairs]
+
+
+def _entry_to_core(entry):
+    """Rebuild the serde enum shape that the native formatter serializes."""
+    diff_type = entry["type"]
+    if diff_type in ("Added", "Removed"):
+        return {diff_type: [entry["path"], entry["value"]]}
+    if diff_type in ("Modified", "TypeChanged"):
+        return {diff_type: [entry["path"], entry["old_value"], entry["new_value"]]}
+    raise ValueError(f"Invalid diff type: {diff_type}")
+
+
+def _format_diffai(results):
+    lines = []
+    for entry in results:
+        diff_type = entry["type"]
+        path = entry["path"]
+        if diff_type == "Added":
+            lines.append(f"  + {path}: {json.dumps(entry['value'])}\n")
+        elif diff_type == "Removed":
+            lines.append(f"  - {path}: {json.dumps(entry['value'])}\n")
+        elif diff_type == "Modified":
+            old_value = json.dumps(entry["old_value"])
+            new_value = json.dumps(entry["new_value"])
+            lines.append(f"  ~ {path}: {old_value} -> {new_value}\n")
+        elif diff_type == "TypeChanged":
+            old_value = json.dumps(entry["old_value"])
+            new_value = json.dumps(entry["new_value"])
+            lines.append(f"  # {path}: {old_value} -> {new_value} (type changed)\n")
+        else:
+            raise ValueError(f"Invalid diff type: {diff_type}")
+    return "".join(lines)
+
+
+def _format_yaml(results):
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError(
+            "yaml output requires PyYAML when using the pure-Python fallback"
+        ) from None
+
+    if not results:
+        return "[]\n"
+    entries = []
+    for entry in results:
+        ((tag, fields),) = _entry_to_core(entry).items()
+        dumped = yaml.safe_dump(fields, sort_keys=False, default_flow_style=False)
+        indented = "".join(f"  {line}\n" for line in dumped.splitlines())
+        entries.append(f"- !{tag}\n{indented}")
+    return "".join(entries)
+
+
+def format_output(results, format):
+    """Format diff results as a string, matching the native formatter.
+
+    JSON and YAML use the core's serde enum shape ({"Modified": [path, old,
+    new]}, tagged !Modified sequences); "diffai" uses the two-space-indented
+    +/-/~/# line format.
+    """
+    if format == "json":
+        return json.dumps([_entry_to_core(entry) for entry in results], indent=2)
+    if format == "diffai":
+        return _format_diffai(results)
+    if format == "yaml":
+        return _format_yaml(results)
+    raise ValueError(f"Invalid format: {format}")
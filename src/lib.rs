@@ -10,10 +10,85 @@ use diffai_core::{
     diff as core_diff, diff_paths as core_diff_paths, format_output as core_format_output,
     DiffOptions, DiffResult, OutputFormat, TensorStats,
 };
+use pyo3::buffer::{Element, PyBuffer};
 use pyo3::prelude::*;
 use pyo3::types::{PyAny, PyDict, PyList};
+use rayon::prelude::*;
 use regex::Regex;
 use serde_json::Value;
+use std::collections::HashMap;
+
+// ============================================================================
+// Pre-compiled options
+// ============================================================================
+
+/// Pre-parsed diff options
+///
+/// Built once via `_compile_options` and passed back through the `options`
+/// kwarg, so repeated calls skip per-call kwargs validation (dict lookups,
+/// float unboxing, regex compilation).
+#[pyclass(frozen, name = "_CompiledOptions")]
+struct CompiledOptions {
+    options: DiffOptions,
+    /// Relative tolerance: values differing by no more than
+    /// `atol + rtol * max(|a|, |b|)` are treated as equal. The core compares
+    /// with the absolute epsilon (= atol); the relative part is applied here
+    /// in the binding.
+    rtol: f64,
+}
+
+/// Parse diff options once and return an opaque reusable handle
+///
+/// Args:
+///     **kwargs: Optional parameters (same as diff())
+///
+/// Returns:
+///     _CompiledOptions: Handle accepted by the `options` kwarg of diff(),
+///     diff_paths(), diff_many(), and diff_paths_many()
+#[pyfunction]
+#[pyo3(name = "_compile_options", signature = (**kwargs))]
+fn compile_options(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<CompiledOptions> {
+    build_options_from_kwargs(kwargs)
+}
+
+/// Options resolved for one call: either a borrowed pre-compiled handle or a
+/// freshly parsed set built from kwargs.
+enum ResolvedOptions<'py> {
+    Compiled(Bound<'py, CompiledOptions>),
+    Owned(CompiledOptions),
+}
+
+impl ResolvedOptions<'_> {
+    fn compiled(&self) -> &CompiledOptions {
+        match self {
+            ResolvedOptions::Compiled(compiled) => compiled.get(),
+            ResolvedOptions::Owned(options) => options,
+        }
+    }
+
+    fn options(&self) -> &DiffOptions {
+        &self.compiled().options
+    }
+}
+
+fn resolve_options<'py>(kwargs: Option<&Bound<'py, PyDict>>) -> PyResult<ResolvedOptions<'py>> {
+    if let Some(kwargs) = kwargs {
+        if let Some(opts) = kwargs.get_item("options")? {
+            if kwargs.len() > 1 {
+                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+                    "options cannot be combined with individual option kwargs",
+                ));
+            }
+            return match opts.downcast_into::<CompiledOptions>() {
+                Ok(compiled) => Ok(ResolvedOptions::Compiled(compiled)),
+                Err(_) => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+                    "options must be a compiled DiffOptions handle",
+                )),
+            };
+        }
+    }
+    Ok(ResolvedOptions::Owned(build_options_from_kwargs(kwargs)?))
+}
 
 // ============================================================================
 // Main diff function
@@ -28,6 +103,9 @@ use serde_json::Value;
 ///     new: The new value (dict, list, or primitive)
 ///     **kwargs: Optional parameters:
 ///         epsilon (float): Numerical comparison tolerance
+///         atol (float): Absolute tolerance (alias of epsilon)
+///         rtol (float): Relative tolerance; numbers within
+///             atol + rtol * max(|a|, |b|) are treated as equal
 ///         array_id_key (str): Key to use for array element identification
 ///         ignore_keys_regex (str): Regex pattern for keys to ignore
 ///         path_filter (str): Only show differences in paths containing this string
@@ -43,13 +121,21 @@ fn diff(
     new: &Bound<'_, PyAny>,
     kwargs: Option<&Bound<'_, PyDict>>,
 ) -> PyResult<PyObject> {
-    let old_json = python_to_json_value(old)?;
-    let new_json = python_to_json_value(new)?;
-    let options = build_options_from_kwargs(kwargs)?;
+    let resolved = resolve_options(kwargs)?;
+
+    // Identity short-circuit: the same object compared against itself cannot
+    // differ, so skip conversion and the core walk entirely. Options are
+    // resolved first so misspelled kwargs still raise on this path.
+    if old.as_ptr() == new.as_ptr() {
+        return Ok(PyList::empty(py).into());
+    }
 
-    let results = core_diff(&old_json, &new_json, Some(&options)).map_err(|e| {
+    let (old_json, new_json) = pair_to_json_values(old, new)?;
+
+    let mut results = core_diff(&old_json, &new_json, Some(resolved.options())).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Diff error: {e}"))
     })?;
+    apply_relative_tolerance(&mut results, resolved.compiled());
 
     let py_results = PyList::empty(py);
     for result in results {
@@ -77,11 +163,13 @@ fn diff_paths(
     new_path: &str,
     kwargs: Option<&Bound<'_, PyDict>>,
 ) -> PyResult<PyObject> {
-    let options = build_options_from_kwargs(kwargs)?;
+    let resolved = resolve_options(kwargs)?;
 
-    let results = core_diff_paths(old_path, new_path, Some(&options)).map_err(|e| {
-        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Diff error: {e}"))
-    })?;
+    let mut results =
+        core_diff_paths(old_path, new_path, Some(resolved.options())).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Diff error: {e}"))
+        })?;
+    apply_relative_tolerance(&mut results, resolved.compiled());
 
     let py_results = PyList::empty(py);
     for result in results {
@@ -92,6 +180,290 @@ fn diff_paths(
     Ok(py_results.into())
 }
 
+/// Compare many (old, new) pairs in a single call
+///
+/// Options are parsed once for the whole batch and the diffs run in parallel
+/// with the GIL released, so N small diffs pay the Python/FFI fixed cost once
+/// instead of N times.
+///
+/// Args:
+///     pairs: List of (old, new) tuples (same value types as diff())
+///     **kwargs: Optional parameters (same as diff())
+///
+/// Returns:
+///     List[List[Dict]]: One result list per input pair, in order
+#[pyfunction]
+#[pyo3(signature = (pairs, **kwargs))]
+fn diff_many(
+    py: Python,
+    pairs: &Bound<'_, PyList>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    let resolved = resolve_options(kwargs)?;
+    let compiled = resolved.compiled();
+    let options = &compiled.options;
+
+    // Conversion needs the GIL; do it up front so the diffs themselves can
+    // run without it.
+    let mut json_pairs = Vec::with_capacity(pairs.len());
+    for pair in pairs.iter() {
+        let (old, new): (Bound<'_, PyAny>, Bound<'_, PyAny>) = pair.extract()?;
+        if old.as_ptr() == new.as_ptr() {
+            // Identity pairs cannot differ; Null vs Null diffs to nothing.
+            json_pairs.push((Value::Null, Value::Null));
+        } else {
+            json_pairs.push(pair_to_json_values(&old, &new)?);
+        }
+    }
+
+    let batches: Result<Vec<Vec<DiffResult>>, String> = py.allow_threads(|| {
+        json_pairs
+            .par_iter()
+            .map(|(old, new)| {
+                core_diff(old, new, Some(options))
+                    .map(|mut results| {
+                        apply_relative_tolerance(&mut results, compiled);
+                        results
+                    })
+                    .map_err(|e| format!("Diff error: {e}"))
+            })
+            .collect()
+    });
+    let batches = batches.map_err(PyErr::new::<pyo3::exceptions::PyRuntimeError, String>)?;
+
+    let py_batches = PyList::empty(py);
+    for batch in batches {
+        let py_results = PyList::empty(py);
+        for result in batch {
+            py_results.append(diff_result_to_python(py, &result)?)?;
+        }
+        py_batches.append(py_results)?;
+    }
+
+    Ok(py_batches.into())
+}
+
+/// Compare many (old_path, new_path) pairs in a single call
+///
+/// Args:
+///     path_pairs: List of (old_path, new_path) tuples
+///     **kwargs: Optional parameters (same as diff())
+///
+/// Returns:
+///     List[List[Dict]]: One result list per input pair, in order
+#[pyfunction]
+#[pyo3(signature = (path_pairs, **kwargs))]
+fn diff_paths_many(
+    py: Python,
+    path_pairs: &Bound<'_, PyList>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<PyObject> {
+    let resolved = resolve_options(kwargs)?;
+    let compiled = resolved.compiled();
+    let options = &compiled.options;
+    let pairs: Vec<(String, String)> = path_pairs.extract()?;
+
+    let batches: Result<Vec<Vec<DiffResult>>, String> = py.allow_threads(|| {
+        pairs
+            .par_iter()
+            .map(|(old_path, new_path)| {
+                core_diff_paths(old_path, new_path, Some(options))
+                    .map(|mut results| {
+                        apply_relative_tolerance(&mut results, compiled);
+                        results
+                    })
+                    .map_err(|e| format!("Diff error: {e}"))
+            })
+            .collect()
+    });
+    let batches = batches.map_err(PyErr::new::<pyo3::exceptions::PyRuntimeError, String>)?;
+
+    let py_batches = PyList::empty(py);
+    for batch in batches {
+        let py_results = PyList::empty(py);
+        for result in batch {
+            py_results.append(diff_result_to_python(py, &result)?)?;
+        }
+        py_batches.append(py_results)?;
+    }
+
+    Ok(py_batches.into())
+}
+
+// ============================================================================
+// Presence check
+// ============================================================================
+
+/// Short-circuit walk over two converted values: true on the first mismatch.
+///
+/// Mirrors the core's comparison semantics (key sets, element order, numeric
+/// tolerance, ignored keys) without allocating any result entries.
+fn values_differ(old: &Value, new: &Value, compiled: &CompiledOptions) -> bool {
+    match (old, new) {
+        (Value::Object(old_map), Value::Object(new_map)) => {
+            let ignore = compiled.options.ignore_keys_regex.as_ref();
+            for (key, old_item) in old_map {
+                if ignore.is_some_and(|re| re.is_match(key)) {
+                    continue;
+                }
+                match new_map.get(key) {
+                    Some(new_item) => {
+                        if values_differ(old_item, new_item, compiled) {
+                            return true;
+                        }
+                    }
+                    None => return true,
+                }
+            }
+            new_map.iter().any(|(key, _)| {
+                !ignore.is_some_and(|re| re.is_match(key)) && !old_map.contains_key(key)
+            })
+        }
+        (Value::Array(old_arr), Value::Array(new_arr)) => {
+            old_arr.len() != new_arr.len()
+                || old_arr
+                    .iter()
+                    .zip(new_arr)
+                    .any(|(old_item, new_item)| values_differ(old_item, new_item, compiled))
+        }
+        (Value::Number(old_num), Value::Number(new_num)) => {
+            if compiled.options.epsilon.is_some() || compiled.rtol > 0.0 {
+                match (old_num.as_f64(), new_num.as_f64()) {
+                    (Some(a), Some(b)) => {
+                        let atol = compiled.options.epsilon.unwrap_or(0.0);
+                        (a - b).abs() > atol + compiled.rtol * a.abs().max(b.abs())
+                    }
+                    _ => old_num != new_num,
+                }
+            } else {
+                old_num != new_num
+            }
+        }
+        _ => old != new,
+    }
+}
+
+/// Check whether any structural difference exists, without materializing entries
+///
+/// Answers the gate-style question "did anything change past the tolerance?"
+/// by returning on the first mismatch, instead of building the full result
+/// list and checking its length. Only the structural entry types (Added,
+/// Removed, Modified, TypeChanged) count; the ML-analysis entries that diff()
+/// may append for model-like inputs do not.
+///
+/// Args:
+///     old: The old value (dict, list, or primitive)
+///     new: The new value (dict, list, or primitive)
+///     **kwargs: Optional parameters (same as diff())
+///
+/// Returns:
+///     bool: True if the values differ past the configured tolerance
+#[pyfunction]
+#[pyo3(signature = (old, new, **kwargs))]
+fn diff_any(
+    old: &Bound<'_, PyAny>,
+    new: &Bound<'_, PyAny>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<bool> {
+    let resolved = resolve_options(kwargs)?;
+    let compiled = resolved.compiled();
+
+    // Resolved above first, so misspelled kwargs still raise here.
+    if old.as_ptr() == new.as_ptr() {
+        return Ok(false);
+    }
+
+    let (old_json, new_json) = pair_to_json_values(old, new)?;
+
+    // Options that re-shape the walk itself are handled by the full diff.
+    if compiled.options.path_filter.is_some() || compiled.options.array_id_key.is_some() {
+        let mut results =
+            core_diff(&old_json, &new_json, Some(&compiled.options)).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Diff error: {e}"))
+            })?;
+        apply_relative_tolerance(&mut results, compiled);
+        // Count only the structural entry types; the core appends ML-analysis
+        // entries without applying path_filter, and values_differ never sees
+        // them, so including them here would make the two branches disagree.
+        return Ok(results.iter().any(|result| {
+            matches!(
+                result,
+                DiffResult::Added(..)
+                    | DiffResult::Removed(..)
+                    | DiffResult::Modified(..)
+                    | DiffResult::TypeChanged(..)
+            )
+        }));
+    }
+
+    Ok(values_differ(&old_json, &new_json, compiled))
+}
+
+// ============================================================================
+// Native results handle
+// ============================================================================
+
+/// Diff results kept on the Rust side
+///
+/// Returned by diff_raw(). Formatting a handle with format_output() writes
+/// the output string directly from the native result vector, skipping the
+/// per-entry Python dict materialization that diff() performs.
+#[pyclass(frozen, name = "_NativeResults")]
+struct NativeResults {
+    results: Vec<DiffResult>,
+}
+
+#[pymethods]
+impl NativeResults {
+    fn __len__(&self) -> usize {
+        self.results.len()
+    }
+
+    /// Materialize the results as the list of dicts that diff() returns.
+    fn to_list(&self, py: Python) -> PyResult<PyObject> {
+        let py_results = PyList::empty(py);
+        for result in &self.results {
+            py_results.append(diff_result_to_python(py, result)?)?;
+        }
+        Ok(py_results.into())
+    }
+}
+
+/// Compare two Python objects, keeping the results on the Rust side
+///
+/// Args:
+///     old: The old value (dict, list, or primitive)
+///     new: The new value (dict, list, or primitive)
+///     **kwargs: Optional parameters (same as diff())
+///
+/// Returns:
+///     _NativeResults: Opaque handle accepted by format_output()
+#[pyfunction]
+#[pyo3(signature = (old, new, **kwargs))]
+fn diff_raw(
+    old: &Bound<'_, PyAny>,
+    new: &Bound<'_, PyAny>,
+    kwargs: Option<&Bound<'_, PyDict>>,
+) -> PyResult<NativeResults> {
+    let resolved = resolve_options(kwargs)?;
+
+    // Resolved above first, so misspelled kwargs still raise here.
+    if old.as_ptr() == new.as_ptr() {
+        return Ok(NativeResults {
+            results: Vec::new(),
+        });
+    }
+
+    let (old_json, new_json) = pair_to_json_values(old, new)?;
+
+    let mut results = core_diff(&old_json, &new_json, Some(resolved.options())).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Diff error: {e}"))
+    })?;
+    apply_relative_tolerance(&mut results, resolved.compiled());
+
+    Ok(NativeResults { results })
+}
+
 // ============================================================================
 // Format output function
 // ============================================================================
@@ -99,19 +471,31 @@ fn diff_paths(
 /// Format diff results as string
 ///
 /// Args:
-///     results: List of diff results from diff() function
+///     results: List of diff results from diff(), or the handle from
+///         diff_raw() (formatted without round-tripping through Python dicts)
 ///     format: Output format ("diffai", "json", "yaml")
 ///
 /// Returns:
 ///     Formatted string output
 #[pyfunction]
-fn format_output(results: &Bound<'_, PyList>, format: &str) -> PyResult<String> {
-    let rust_results = python_results_to_rust(results)?;
-
+fn format_output(results: &Bound<'_, PyAny>, format: &str) -> PyResult<String> {
     let output_format = OutputFormat::parse_format(format).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid format: {e}"))
     })?;
 
+    if let Ok(native) = results.downcast::<NativeResults>() {
+        return core_format_output(&native.get().results, output_format).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Format error: {e}"))
+        });
+    }
+
+    let list = results.downcast::<PyList>().map_err(|_| {
+        PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "results must be a list of diff dicts or a diff_raw() handle",
+        )
+    })?;
+    let rust_results = python_results_to_rust(list)?;
+
     core_format_output(&rust_results, output_format).map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Format error: {e}"))
     })
@@ -121,7 +505,191 @@ fn format_output(results: &Bound<'_, PyList>, format: &str) -> PyResult<String>
 // Helper functions
 // ============================================================================
 
+/// Cheap flag check for the buffer protocol.
+///
+/// Must gate every `PyBuffer::get` probe: a failed probe raises and clears a
+/// Python `TypeError`, which is expensive enough to dominate scalar-heavy
+/// workloads if paid per leaf.
+fn supports_buffer_protocol(py_obj: &Bound<'_, PyAny>) -> bool {
+    unsafe { pyo3::ffi::PyObject_CheckBuffer(py_obj.as_ptr()) != 0 }
+}
+
+/// Extract a contiguous float buffer (numpy.ndarray, memoryview, array.array,
+/// torch.Tensor, ...) as a JSON array in a single bulk copy.
+///
+/// This avoids crossing the FFI boundary once per element: a tensor leaf is
+/// copied out of the exporter's buffer in one memcpy instead of N
+/// `PyFloat_AsDouble` round-trips with N `PyObject` temporaries.
+fn float_buffer_to_json<T>(py_obj: &Bound<'_, PyAny>) -> Option<Value>
+where
+    T: Element + Copy + Into<f64>,
+{
+    let py = py_obj.py();
+    let buffer = PyBuffer::<T>::get(py_obj).ok()?;
+    let shape = buffer.shape().to_vec();
+    // `to_vec` copies through `PyBuffer_ToContiguous`, which handles strided
+    // views too, so e.g. a memoryview slice with a step is read correctly.
+    let values: Vec<f64> = buffer
+        .to_vec(py)
+        .ok()?
+        .into_iter()
+        .map(Into::into)
+        .collect();
+    Some(floats_to_nested_value(&values, &shape))
+}
+
+/// Detect a zero-length float buffer via the raw buffer API.
+///
+/// Empty buffers can use a dummy base pointer that fails `PyBuffer`'s
+/// alignment check (array.array's shared empty-buffer sentinel is
+/// char-aligned), so the typed probes above reject them even though an empty
+/// tensor is valid input.
+fn empty_float_buffer_to_json(py_obj: &Bound<'_, PyAny>) -> Option<Value> {
+    let mut view = unsafe { std::mem::zeroed::<pyo3::ffi::Py_buffer>() };
+    let rc = unsafe {
+        pyo3::ffi::PyObject_GetBuffer(
+            py_obj.as_ptr(),
+            &mut view,
+            pyo3::ffi::PyBUF_FORMAT | pyo3::ffi::PyBUF_ND,
+        )
+    };
+    if rc != 0 {
+        unsafe { pyo3::ffi::PyErr_Clear() };
+        return None;
+    }
+
+    let is_empty_float = view.len == 0
+        && !view.format.is_null()
+        && matches!(
+            unsafe { std::ffi::CStr::from_ptr(view.format) }.to_bytes(),
+            b"f" | b"d" | [b'<' | b'>' | b'=' | b'@', b'f' | b'd']
+        );
+    unsafe { pyo3::ffi::PyBuffer_Release(&mut view) };
+
+    if is_empty_float {
+        Some(Value::Array(Vec::new()))
+    } else {
+        None
+    }
+}
+
+/// Rebuild an N-dimensional buffer as nested JSON arrays from its flattened
+/// C-order contents.
+fn floats_to_nested_value(values: &[f64], shape: &[usize]) -> Value {
+    if shape.len() <= 1 {
+        return Value::Array(
+            values
+                .iter()
+                .map(|f| Value::Number(serde_json::Number::from_f64(*f).unwrap_or(0.into())))
+                .collect(),
+        );
+    }
+    if values.is_empty() {
+        return Value::Array(Vec::new());
+    }
+    let chunk = values.len() / shape[0];
+    Value::Array(
+        values
+            .chunks(chunk)
+            .map(|c| floats_to_nested_value(c, &shape[1..]))
+            .collect(),
+    )
+}
+
+/// Check whether an object exports a float buffer without converting it.
+fn is_float_buffer(py_obj: &Bound<'_, PyAny>) -> bool {
+    supports_buffer_protocol(py_obj)
+        && (PyBuffer::<f64>::get(py_obj).is_ok() || PyBuffer::<f32>::get(py_obj).is_ok())
+}
+
+/// Count occurrences of container and buffer nodes by address, so the
+/// conversion pass can memoize subtrees that are aliased (appear more than
+/// once) and convert them only once. Counting stops at the first revisit.
+fn count_shared_nodes(py_obj: &Bound<'_, PyAny>, counts: &mut HashMap<usize, u32>) {
+    if let Ok(list) = py_obj.downcast::<PyList>() {
+        let count = counts.entry(py_obj.as_ptr() as usize).or_insert(0);
+        *count += 1;
+        if *count > 1 {
+            return;
+        }
+        for item in list.iter() {
+            count_shared_nodes(&item, counts);
+        }
+    } else if let Ok(dict) = py_obj.downcast::<PyDict>() {
+        let count = counts.entry(py_obj.as_ptr() as usize).or_insert(0);
+        *count += 1;
+        if *count > 1 {
+            return;
+        }
+        for (_, value) in dict.iter() {
+            count_shared_nodes(&value, counts);
+        }
+    } else if is_float_buffer(py_obj) {
+        *counts.entry(py_obj.as_ptr() as usize).or_insert(0) += 1;
+    }
+}
+
 fn python_to_json_value(py_obj: &Bound<'_, PyAny>) -> PyResult<Value> {
+    let mut shared = HashMap::new();
+    count_shared_nodes(py_obj, &mut shared);
+    let mut memo = HashMap::new();
+    python_to_json_value_memo(py_obj, &shared, &mut memo)
+}
+
+/// Convert both sides of a diff with one shared conversion memo, so subtrees
+/// aliased within or between the two structures (e.g. an unchanged weight
+/// array referenced from both checkpoints) are converted once.
+fn pair_to_json_values(old: &Bound<'_, PyAny>, new: &Bound<'_, PyAny>) -> PyResult<(Value, Value)> {
+    let mut shared = HashMap::new();
+    count_shared_nodes(old, &mut shared);
+    count_shared_nodes(new, &mut shared);
+    let mut memo = HashMap::new();
+    let old_json = python_to_json_value_memo(old, &shared, &mut memo)?;
+    let new_json = python_to_json_value_memo(new, &shared, &mut memo)?;
+    Ok((old_json, new_json))
+}
+
+fn python_to_json_value_memo(
+    py_obj: &Bound<'_, PyAny>,
+    shared: &HashMap<usize, u32>,
+    memo: &mut HashMap<usize, Value>,
+) -> PyResult<Value> {
+    let ptr = py_obj.as_ptr() as usize;
+    let is_shared = shared.get(&ptr).is_some_and(|count| *count > 1);
+    if is_shared {
+        if let Some(cached) = memo.get(&ptr) {
+            return Ok(cached.clone());
+        }
+    }
+
+    let value = convert_python_to_json(py_obj, shared, memo)?;
+
+    if is_shared {
+        memo.insert(ptr, value.clone());
+    }
+    Ok(value)
+}
+
+fn convert_python_to_json(
+    py_obj: &Bound<'_, PyAny>,
+    shared: &HashMap<usize, u32>,
+    memo: &mut HashMap<usize, Value>,
+) -> PyResult<Value> {
+    // Buffer-protocol fast path for tensor-like leaves. Checked first so that
+    // float arrays never take the per-element conversion below; the flag
+    // check keeps the probes away from scalar leaves.
+    if supports_buffer_protocol(py_obj) {
+        if let Some(value) = float_buffer_to_json::<f64>(py_obj) {
+            return Ok(value);
+        }
+        if let Some(value) = float_buffer_to_json::<f32>(py_obj) {
+            return Ok(value);
+        }
+        if let Some(value) = empty_float_buffer_to_json(py_obj) {
+            return Ok(value);
+        }
+    }
+
     if py_obj.is_none() {
         Ok(Value::Null)
     } else if let Ok(b) = py_obj.extract::<bool>() {
@@ -137,14 +705,14 @@ fn python_to_json_value(py_obj: &Bound<'_, PyAny>) -> PyResult<Value> {
     } else if let Ok(list) = py_obj.downcast::<PyList>() {
         let mut vec = Vec::new();
         for item in list.iter() {
-            vec.push(python_to_json_value(&item)?);
+            vec.push(python_to_json_value_memo(&item, shared, memo)?);
         }
         Ok(Value::Array(vec))
     } else if let Ok(dict) = py_obj.downcast::<PyDict>() {
         let mut map = serde_json::Map::new();
         for (key, value) in dict.iter() {
             let key_str = key.extract::<String>()?;
-            let json_value = python_to_json_value(&value)?;
+            let json_value = python_to_json_value_memo(&value, shared, memo)?;
             map.insert(key_str, json_value);
         }
         Ok(Value::Object(map))
@@ -365,14 +933,55 @@ fn python_results_to_rust(results: &Bound<'_, PyList>) -> PyResult<Vec<DiffResul
     Ok(rust_results)
 }
 
-fn build_options_from_kwargs(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<DiffOptions> {
+/// Option kwargs accepted by every diff entry point.
+const KNOWN_OPTION_KEYS: [&str; 7] = [
+    "epsilon",
+    "atol",
+    "rtol",
+    "array_id_key",
+    "ignore_keys_regex",
+    "path_filter",
+    "output_format",
+];
+
+fn build_options_from_kwargs(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<CompiledOptions> {
     let mut options = DiffOptions::default();
+    let mut rtol = 0.0;
 
     if let Some(kwargs) = kwargs {
+        // Reject misspelled options instead of silently ignoring them; the
+        // pure-Python fallback does the same.
+        for key in kwargs.keys() {
+            let key_str: String = key.extract()?;
+            if !KNOWN_OPTION_KEYS.contains(&key_str.as_str()) {
+                return Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+                    "got an unexpected keyword argument '{key_str}'"
+                )));
+            }
+        }
+
         if let Some(epsilon) = kwargs.get_item("epsilon")? {
             options.epsilon = Some(epsilon.extract::<f64>()?);
         }
 
+        if let Some(atol) = kwargs.get_item("atol")? {
+            if options.epsilon.is_some() {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "epsilon is an alias for atol; specify only one",
+                ));
+            }
+            options.epsilon = Some(atol.extract::<f64>()?);
+        }
+
+        if let Some(rtol_value) = kwargs.get_item("rtol")? {
+            rtol = rtol_value.extract::<f64>()?;
+            if rtol < 0.0 {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "rtol must be non-negative",
+                ));
+            }
+        }
+
         if let Some(array_id_key) = kwargs.get_item("array_id_key")? {
             options.array_id_key = Some(array_id_key.extract::<String>()?);
         }
@@ -400,7 +1009,31 @@ fn build_options_from_kwargs(kwargs: Option<&Bound<'_, PyDict>>) -> PyResult<Dif
         }
     }
 
-    Ok(options)
+    Ok(CompiledOptions { options, rtol })
+}
+
+/// Check whether two values are numbers within `atol + rtol * max(|a|, |b|)`.
+fn within_tolerance(old: &Value, new: &Value, atol: f64, rtol: f64) -> bool {
+    match (old.as_f64(), new.as_f64()) {
+        (Some(a), Some(b)) => (a - b).abs() <= atol + rtol * a.abs().max(b.abs()),
+        _ => false,
+    }
+}
+
+/// Drop numeric modifications that fall within the combined tolerance.
+///
+/// The core already filters by the absolute epsilon (= atol), which is a
+/// lower bound on the combined threshold, so only the surviving entries need
+/// the relative check.
+fn apply_relative_tolerance(results: &mut Vec<DiffResult>, compiled: &CompiledOptions) {
+    if compiled.rtol <= 0.0 {
+        return;
+    }
+    let atol = compiled.options.epsilon.unwrap_or(0.0);
+    results.retain(|result| match result {
+        DiffResult::Modified(_, old, new) => !within_tolerance(old, new, atol, compiled.rtol),
+        _ => true,
+    });
 }
 
 // ============================================================================
@@ -417,6 +1050,21 @@ fn _diffai(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(diff, m)?)?;
     m.add_function(wrap_pyfunction!(diff_paths, m)?)?;
 
+    // Batched diff functions
+    m.add_function(wrap_pyfunction!(diff_many, m)?)?;
+    m.add_function(wrap_pyfunction!(diff_paths_many, m)?)?;
+
+    // Pre-compiled options
+    m.add_class::<CompiledOptions>()?;
+    m.add_function(wrap_pyfunction!(compile_options, m)?)?;
+
+    // Presence check
+    m.add_function(wrap_pyfunction!(diff_any, m)?)?;
+
+    // Native results handle
+    m.add_class::<NativeResults>()?;
+    m.add_function(wrap_pyfunction!(diff_raw, m)?)?;
+
     // Format output function
     m.add_function(wrap_pyfunction!(format_output, m)?)?;
 
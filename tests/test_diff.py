@@ -13,6 +13,23 @@ def test_import():
     assert hasattr(diffai, "__version__")
 
 
+def test_import_is_lazy():
+    """Test that importing diffai does not load the backend extension."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import diffai\n"
+        "assert diffai.__version__\n"
+        "assert 'diffai._diffai' not in sys.modules\n"
+        "assert 'diffai._fallback' not in sys.modules\n"
+        "diffai.diff({'a': 1}, {'a': 2})\n"
+        "assert 'diffai._diffai' in sys.modules or 'diffai._fallback' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_diff_identical():
     """Test diffing identical objects."""
     import diffai
@@ -23,6 +40,17 @@ def test_diff_identical():
     assert len(results) == 0
 
 
+def test_diff_shared_subtree():
+    """Test that subtrees aliased between old and new compare clean."""
+    import diffai
+
+    config = {"layer_sizes": [128, 64]}
+    old = {"config": config, "step": 1}
+    new = {"config": config, "step": 2}
+    results = diffai.diff(old, new)
+    assert [r["path"] for r in results] == ["step"]
+
+
 def test_diff_added():
     """Test detecting added keys."""
     import diffai
@@ -85,6 +113,37 @@ def test_diff_with_epsilon():
     assert len(results_with) == 0
 
 
+def test_diff_with_rtol():
+    """Test relative tolerance across values of different magnitudes."""
+    import diffai
+
+    old = {"logits": 100.0, "grad": 1e-8}
+    new = {"logits": 100.05, "grad": 2e-8}
+    results = diffai.diff(old, new, rtol=1e-3)
+    paths = [r["path"] for r in results]
+    assert "logits" not in paths
+    assert "grad" in paths
+
+
+def test_diff_negative_rtol():
+    """Test that a negative rtol is rejected."""
+    import diffai
+
+    with pytest.raises(ValueError):
+        diffai.diff({"a": 1.0}, {"a": 2.0}, rtol=-0.1)
+
+
+def test_diff_atol_alias():
+    """Test that atol behaves as an alias of epsilon."""
+    import diffai
+
+    old = {"value": 1.0}
+    new = {"value": 1.0001}
+    assert len(diffai.diff(old, new, atol=0.001)) == 0
+    with pytest.raises(ValueError):
+        diffai.diff(old, new, epsilon=0.001, atol=0.001)
+
+
 def test_diff_tensor_like():
     """Test handling tensor-like data."""
     import diffai
@@ -95,6 +154,117 @@ def test_diff_tensor_like():
     assert isinstance(results, list)
 
 
+def test_diff_options():
+    """Test passing a pre-compiled DiffOptions instance."""
+    import diffai
+
+    opts = diffai.DiffOptions(epsilon=0.001)
+    old = {"value": 1.0}
+    new = {"value": 1.0001}
+    results = diffai.diff(old, new, options=opts)
+    assert len(results) == 0
+
+
+def test_diff_unknown_kwarg():
+    """Test that misspelled option kwargs are rejected."""
+    import diffai
+
+    with pytest.raises(TypeError):
+        diffai.diff({"a": 1}, {"a": 2}, epslon=0.5)
+
+
+def test_diff_identity_still_validates_kwargs():
+    """Test that the identity fast path does not skip kwargs validation."""
+    import diffai
+
+    obj = {"a": 1}
+    with pytest.raises(TypeError):
+        diffai.diff(obj, obj, epslon=1)
+    with pytest.raises(TypeError):
+        diffai.diff_any(obj, obj, epslon=1)
+    opts = diffai.DiffOptions(epsilon=0.001)
+    with pytest.raises(TypeError):
+        diffai.diff(obj, obj, options=opts, epsilon=10.0)
+
+
+def test_diff_options_kwargs_conflict():
+    """Test that options= cannot be combined with option kwargs."""
+    import diffai
+
+    opts = diffai.DiffOptions(epsilon=0.001)
+    with pytest.raises(TypeError):
+        diffai.diff({"a": 1}, {"a": 2}, options=opts, epsilon=10.0)
+
+
+def test_diff_options_compile_cached():
+    """Test that DiffOptions compiles its native handle only once."""
+    import diffai
+
+    opts = diffai.DiffOptions(epsilon=0.001)
+    assert opts.compile() is opts.compile()
+
+
+def test_diff_many():
+    """Test batched diffing of multiple pairs."""
+    import diffai
+
+    pairs = [
+        ({"a": 1}, {"a": 1}),
+        ({"a": 1}, {"a": 2}),
+        ({"a": 1}, {"a": 1, "b": 2}),
+    ]
+    batches = diffai.diff_many(pairs)
+    assert len(batches) == 3
+    assert len(batches[0]) == 0
+    assert batches[1][0]["type"] == "Modified"
+    assert batches[2][0]["type"] == "Added"
+
+
+def test_diff_many_with_epsilon():
+    """Test that batch options apply to every pair."""
+    import diffai
+
+    pairs = [({"value": 1.0}, {"value": 1.0001})] * 2
+    batches = diffai.diff_many(pairs, epsilon=0.001)
+    assert all(len(batch) == 0 for batch in batches)
+
+
+def test_diff_many_with_options():
+    """Test that diff_many compiles a DiffOptions instance like diff()."""
+    import diffai
+
+    opts = diffai.DiffOptions(epsilon=0.001)
+    pairs = [({"value": 1.0}, {"value": 1.0001})] * 2
+    batches = diffai.diff_many(pairs, options=opts)
+    assert all(len(batch) == 0 for batch in batches)
+
+
+def test_diff_buffer_protocol():
+    """Test that contiguous float buffers (numpy-style) work as tensor leaves."""
+    import array
+
+    import diffai
+
+    old = {"layers": [{"weight": array.array("d", [1.0, 2.0, 3.0])}]}
+    new = {"layers": [{"weight": array.array("d", [1.0, 2.0, 4.0])}]}
+    results = diffai.diff(old, new)
+    assert isinstance(results, list)
+    assert len(results) >= 1
+
+
+def test_diff_empty_buffer():
+    """Test that zero-length float buffers are valid tensor leaves."""
+    import array
+
+    import diffai
+
+    old = {"weight": array.array("d", [])}
+    new = {"weight": array.array("d", [1.0])}
+    results = diffai.diff(old, new)
+    assert any(r["type"] == "Added" and r["path"] == "weight[0]" for r in results)
+    assert diffai.diff({"weight": array.array("d", [])}, {"weight": []}) == []
+
+
 def test_format_output_json():
     """Test formatting results as JSON."""
     import diffai
@@ -109,6 +279,51 @@ def test_format_output_json():
     assert isinstance(parsed, list)
 
 
+def test_diff_any():
+    """Test the yes/no presence check."""
+    import diffai
+
+    old = {"layers": [{"weight": [1.0, 2.0, 3.0]}]}
+    same = {"layers": [{"weight": [1.0, 2.0, 3.0]}]}
+    changed = {"layers": [{"weight": [1.0, 2.0, 4.0]}]}
+    assert diffai.diff_any(old, old) is False
+    assert diffai.diff_any(old, same) is False
+    assert diffai.diff_any(old, changed) is True
+
+
+def test_diff_any_with_epsilon():
+    """Test that the presence check respects the tolerance options."""
+    import diffai
+
+    old = {"value": 1.0}
+    new = {"value": 1.0001}
+    assert diffai.diff_any(old, new) is True
+    assert diffai.diff_any(old, new, epsilon=0.001) is False
+
+
+def test_diff_any_structural_only():
+    """Test that diff_any counts only structural entries in both branches."""
+    import diffai
+
+    old = {"weight": [1.0, 2.0]}
+    new = {"weight": [1.0, 2.1]}
+    assert diffai.diff_any(old, new, epsilon=1.0) is False
+    assert diffai.diff_any(old, new, epsilon=1.0, path_filter="zzz") is False
+
+
+def test_diff_raw_format_output():
+    """Test formatting backend-held results without materializing dicts."""
+    import json
+
+    import diffai
+
+    raw = diffai.diff_raw({"a": 1}, {"a": 2})
+    assert len(raw) == 1
+    formatted = diffai.format_output(raw, "json")
+    assert isinstance(json.loads(formatted), list)
+    assert raw.to_list()[0]["type"] == "Modified"
+
+
 def test_format_output_diffai():
     """Test formatting results as diffai format."""
     import diffai
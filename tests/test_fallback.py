@@ -0,0 +1,177 @@
+"""Tests for the pure-Python fallback backend."""
+
+import pytest
+
+
+def test_fallback_diff_added_removed():
+    """Test added/removed key detection in the fallback backend."""
+    from diffai import _fallback
+
+    old = {"a": 1, "b": 2}
+    new = {"a": 1, "c": 3}
+    results = _fallback.diff(old, new)
+    changes = {(r["type"], r["path"]) for r in results}
+    assert ("Removed", "b") in changes
+    assert ("Added", "c") in changes
+
+
+def test_fallback_diff_modified():
+    """Test modified value detection in the fallback backend."""
+    from diffai import _fallback
+
+    results = _fallback.diff({"a": 1}, {"a": 2})
+    assert len(results) == 1
+    assert results[0]["type"] == "Modified"
+    assert results[0]["old_value"] == 1
+    assert results[0]["new_value"] == 2
+
+
+def test_fallback_diff_nested_paths():
+    """Test that nested paths match the native format."""
+    from diffai import _fallback
+
+    old = {"layers": [{"weight": [1.0, 2.0, 3.0]}]}
+    new = {"layers": [{"weight": [1.0, 2.0, 4.0]}]}
+    results = _fallback.diff(old, new)
+    assert len(results) == 1
+    assert results[0]["path"] == "layers[0].weight[2]"
+
+
+def test_fallback_diff_epsilon():
+    """Test epsilon tolerance in the fallback backend."""
+    from diffai import _fallback
+
+    old = {"value": 1.0}
+    new = {"value": 1.0001}
+    assert len(_fallback.diff(old, new)) == 1
+    assert len(_fallback.diff(old, new, epsilon=0.001)) == 0
+
+
+def test_fallback_diff_rtol():
+    """Test relative tolerance in the fallback backend."""
+    from diffai import _fallback
+
+    old = {"logits": 100.0, "grad": 1e-8}
+    new = {"logits": 100.05, "grad": 2e-8}
+    results = _fallback.diff(old, new, rtol=1e-3)
+    assert [r["path"] for r in results] == ["grad"]
+
+
+def test_fallback_diff_int_vs_float():
+    """Test that an int and a float differ exactly, like serde numbers."""
+    from diffai import _fallback
+
+    results = _fallback.diff({"a": 1}, {"a": 1.0})
+    assert len(results) == 1
+    assert results[0]["type"] == "Modified"
+    assert len(_fallback.diff({"a": 1}, {"a": 1.0}, epsilon=0.1)) == 0
+
+
+def test_fallback_diff_array_id_key():
+    """Test core-style id matching: quoted string ids, positional id-less items."""
+    from diffai import _fallback
+
+    old = {"items": [{"id": "x", "v": 1}, {"v": 9}]}
+    new = {"items": [{"id": "x", "v": 2}, {"v": 10}, {"id": "y", "v": 5}]}
+    results = _fallback.diff(old, new, array_id_key="id")
+    changes = {(r["type"], r["path"]) for r in results}
+    assert changes == {
+        ("Modified", 'items[id="x"].v'),
+        ("Added", 'items[id="y"]'),
+        ("Modified", "items[1].v"),
+    }
+
+
+def test_fallback_diff_type_changed():
+    """Test type change detection in the fallback backend."""
+    from diffai import _fallback
+
+    results = _fallback.diff({"a": 1}, {"a": "1"})
+    assert len(results) == 1
+    assert results[0]["type"] == "TypeChanged"
+
+
+def test_fallback_diff_any():
+    """Test the presence check in the fallback backend."""
+    from diffai import _fallback
+
+    old = {"a": {"b": [1.0, 2.0]}}
+    assert _fallback.diff_any(old, {"a": {"b": [1.0, 2.0]}}) is False
+    assert _fallback.diff_any(old, {"a": {"b": [1.0, 2.5]}}) is True
+    assert _fallback.diff_any(old, {"a": {"b": [1.0, 2.5]}}, epsilon=1.0) is False
+
+
+def test_fallback_format_output_json():
+    """Test that JSON formatting uses the core's serde enum shape."""
+    import json
+
+    from diffai import _fallback
+
+    results = _fallback.diff({"a": 1}, {"a": 2})
+    formatted = _fallback.format_output(results, "json")
+    assert json.loads(formatted) == [{"Modified": ["a", 1, 2]}]
+
+
+def test_fallback_format_output_diffai():
+    """Test that diffai formatting matches the core's line format."""
+    from diffai import _fallback
+
+    results = [
+        {"type": "Removed", "path": "d", "value": 5},
+        {"type": "Modified", "path": "a", "old_value": 1, "new_value": 3},
+        {"type": "Added", "path": "c", "value": 4},
+        {"type": "TypeChanged", "path": "t", "old_value": "x", "new_value": 1},
+    ]
+    assert _fallback.format_output(results, "diffai") == (
+        '  - d: 5\n  ~ a: 1 -> 3\n  + c: 4\n  # t: "x" -> 1 (type changed)\n'
+    )
+
+
+def test_fallback_format_output_matches_native():
+    """Test byte-for-byte parity with the native formatter when available."""
+    pytest.importorskip("diffai._diffai")
+    from diffai import _diffai, _fallback
+
+    results = [
+        {"type": "Removed", "path": "d", "value": 5},
+        {"type": "Modified", "path": "a", "old_value": 1, "new_value": 3},
+        {"type": "Added", "path": "c", "value": 4},
+        {"type": "TypeChanged", "path": "t", "old_value": "x", "new_value": 1},
+    ]
+    for fmt in ("json", "diffai", "yaml"):
+        assert _fallback.format_output(results, fmt) == _diffai.format_output(
+            results, fmt
+        )
+
+
+def test_fallback_format_output_invalid():
+    """Test that an unknown format raises ValueError."""
+    from diffai import _fallback
+
+    with pytest.raises(ValueError):
+        _fallback.format_output([], "xml")
+
+
+def test_fallback_diff_many():
+    """Test batched diffing in the fallback backend."""
+    from diffai import _fallback
+
+    batches = _fallback.diff_many([({"a": 1}, {"a": 1}), ({"a": 1}, {"a": 2})])
+    assert len(batches) == 2
+    assert len(batches[0]) == 0
+    assert len(batches[1]) == 1
+
+
+def test_fallback_diff_paths_json(tmp_path):
+    """Test JSON file comparison in the fallback backend."""
+    import json
+
+    from diffai import _fallback
+
+    old_file = tmp_path / "old.json"
+    new_file = tmp_path / "new.json"
+    old_file.write_text(json.dumps({"a": 1}))
+    new_file.write_text(json.dumps({"a": 2}))
+    results = _fallback.diff_paths(str(old_file), str(new_file))
+    assert len(results) == 1
+    assert results[0]["type"] == "Modified"